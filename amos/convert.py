@@ -66,7 +66,6 @@ from collections.abc import (
     Sequence, Set)
 import datetime
 import functools
-import inspect
 import itertools
 import pathlib
 from typing import Any, Callable, Optional, Type, TYPE_CHECKING, Union
@@ -95,7 +94,7 @@ def instancify(item: Union[Type[Any], object], **kwargs: Any) -> Any:
             parameters (if 'item' is a class).
         
     """         
-    if inspect.isclass(item):
+    if isinstance(item, type):
         return item(**kwargs) # type: ignore
     elif isinstance(item, object):
         for key, value in kwargs.items():
@@ -125,12 +124,19 @@ def iterify(item: Any) -> Iterable:
         except TypeError:
             return iter((item,))
         
-def kwargify(item: Type[Any], args: tuple[Any]) -> dict[Hashable, Any]:
+def kwargify(
+    item: Type[Any], 
+    args: tuple[Any],
+    names: Optional[Sequence[str]] = None) -> dict[Hashable, Any]:
     """Converts args to kwargs.
     
     Args:
         args (tuple): arguments without keywords passed to 'item'.
         item (Type): the item with annotations used to construct kwargs.
+        names (Optional[Sequence[str]]): names of the annotations of 'item'. 
+            Callers that convert args for the same 'item' many times can find
+            the names once and pass them. Defaults to None, in which case the
+            names are read from 'item'.
     
     Raises:
         ValueError: if there are more args than annotations in 'item'.
@@ -139,7 +145,10 @@ def kwargify(item: Type[Any], args: tuple[Any]) -> dict[Hashable, Any]:
         dict[Hashable, Any]: kwargs based on 'args' and 'item'.
     
     """
-    annotations = list(item.__annotations__.keys())
+    if names is None:
+        annotations = list(item.__annotations__.keys())
+    else:
+        annotations = names
     if len(args) > len(annotations):
         raise ValueError('There are too many args for item')
     else:
@@ -187,10 +196,9 @@ def namify(item: Any, default: Optional[str] = None) -> Optional[str]:
     """        
     if isinstance(item, str):
         return item
-    elif (
-        hasattr(item, 'name') 
-        and not inspect.isclass(item)
-        and isinstance(item.name, str)):
+    elif isinstance(item, type):
+        return modify.snakify(item.__name__)
+    elif hasattr(item, 'name') and isinstance(item.name, str):
         return item.name
     else:
         try:
@@ -48,24 +48,32 @@ ToDo:
 
 from __future__ import annotations
 import abc
-import contextlib
-from collections.abc import Mapping, MutableMapping, Sequence
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 import copy
-import dataclasses
-from typing import Any, ClassVar, Optional, Type, Union
+import functools
+import inspect
+import types
+from typing import Any, ClassVar, Optional, Type, Union, get_type_hints
+import weakref
 
 from . import convert
 from . import mapping
-from . import modify
 
- 
-@dataclasses.dataclass
+
 class BaseFactory(abc.ABC):
-    """Base class for factory mixins."""
+    """Base class for factory mixins.
+    
+    Factory mixins have no instance fields, so each one declares empty 
+    '__slots__'. This means a mixin does not add a '__dict__' to a subclass 
+    that declares its own '__slots__'.
+    
+    """
+    __slots__ = ()
     
     """ Required Subclass Methods """
 
-    @abc.abstractclassmethod
+    @classmethod
+    @abc.abstractmethod
     def create(
         cls,
         source: Any, 
@@ -82,24 +90,58 @@ class BaseFactory(abc.ABC):
         pass
 
    
-@dataclasses.dataclass
 class InstanceFactory(BaseFactory):
     """Mixin which automatically registers and stores subclass instances.
     
+    Instances are registered in '__post_init__', so subclasses should be 
+    dataclasses or otherwise call '__post_init__' when they are initialized.
+    Instances are stored by weak reference, so a registered instance is dropped
+    from 'instances' once nothing else refers to it. This keeps 'instances'
+    from growing without bound in long-running programs. Because of this, 
+    subclasses must support weak references: if a subclass declares 
+    '__slots__', it must include '__weakref__'.
+    
+    Pooling of created instances is opt-in and requires a 'reset' method that
+    returns an instance to the state of the stored instance it was created 
+    from. An instance passed to 'release' is reset and stored in the '_pools' 
+    of its class so that a later call to 'create' reuses it instead of deep 
+    copying the stored instance. This only pays off when deep copying an 
+    instance costs more than resetting it.
+    
     Args:
-        instances (ClassVar[mapping.Catalog]): catalog of subclass instances.
+        instances (ClassVar[weakref.WeakValueDictionary]): subclass instances 
+            stored by weak reference.
+        _pools (ClassVar[dict[str, list[InstanceFactory]]]): released 
+            instances for each key in 'instances'. Each subclass has its own
+            '_pools'. Defaults to an empty dict.
+        _pool_limit (ClassVar[int]): maximum number of released instances 
+            stored for each key in 'instances'. Instances released beyond the
+            limit are discarded. Defaults to 8.
             
     """
-    instances: ClassVar[mapping.Catalog] = mapping.Catalog()
+    __slots__ = ()
+    instances: ClassVar[weakref.WeakValueDictionary] = (
+        weakref.WeakValueDictionary())
+    _pools: ClassVar[dict[str, list[InstanceFactory]]] = {}
+    _pool_limit: ClassVar[int] = 8
     
     """ Initialization Methods """
+    
+    @classmethod
+    def __init_subclass__(cls, *args: Any, **kwargs: Any):
+        """Gives the subclass its own pools of released instances."""
+        # Because InstanceFactory is used as a mixin, it is important to
+        # call other base class '__init_subclass__' methods.
+        super().__init_subclass__(*args, **kwargs) # type: ignore
+        cls._pools = {}
             
     def __post_init__(self) -> None:
         """Automatically registers subclass."""
         # Because InstanceFactory is used as a mixin, it is important to
-        # call other base class '__init_subclass__' methods, if they exist.
-        with contextlib.suppress(AttributeError):
-            super().__post_init__(*args, **kwargs) # type: ignore
+        # call other base class '__post_init__' methods, if they exist.
+        post_init = getattr(super(), '__post_init__', None)
+        if post_init is not None:
+            post_init()
         key = convert.namify(item = self)
         self.__class__.instances[key] = self
         
@@ -128,10 +170,41 @@ class InstanceFactory(BaseFactory):
             for key in source:
                 instances.append(cls._create_instance(source = key, **kwargs))
             return instances
-        elif isinstance(cls.instances[source], list):
-            pass
         else:
             return cls._create_instance(source = source, **kwargs)  
+
+    @classmethod
+    def release(cls, instance: InstanceFactory, source: str) -> None:
+        """Resets 'instance' and stores it for reuse by 'create'.
+        
+        'source' is required because the name of 'instance' may differ from 
+        the key it was created from (for example, if a 'name' kwarg was passed
+        to 'create'). 'instance' is discarded if '_pool_limit' released 
+        instances are already stored for 'source'.
+        
+        Args:
+            instance (InstanceFactory): instance previously returned by 
+                'create'.
+            source (str): key for the stored instance that 'instance' was 
+                created from.
+                
+        Raises:
+            AttributeError: if 'instance' does not have a 'reset' method.
+            KeyError: if 'source' is not a key in 'instances'.
+                
+        """
+        reset = getattr(instance, 'reset', None)
+        if reset is None:
+            raise AttributeError(
+                f'{type(instance).__name__} needs a reset method to be pooled')
+        if source not in cls.instances:
+            cls._pools.pop(source, None)
+            raise KeyError(f'{source} is not a key in instances')
+        pool = cls._pools.setdefault(source, [])
+        if len(pool) < cls._pool_limit:
+            reset()
+            pool.append(instance)
+        return
     
     """ Private Methods """
     
@@ -140,7 +213,10 @@ class InstanceFactory(BaseFactory):
         """Creates an instance of a InstanceFactory subclass from 'source'.
         
         If kwargs are passed, they are added as attributes to the returned 
-        instance.
+        instance with 'setattr', so properties, slots, and any custom 
+        '__setattr__' method of the instance are respected. If an 
+        instance for 'source' was passed to 'release', it is reused instead of
+        deep copying the stored instance.
         
         Args:
             source (str): key for item stored in 'instances'.
@@ -150,14 +226,23 @@ class InstanceFactory(BaseFactory):
                 'source' and any passed arguments.
                 
         """
-        instance = copy.deepcopy(cls.instances[source])
-        if kwargs:
-            for key, value in kwargs.items():
-                setattr(instance, key, value)
+        try:
+            prototype = cls.instances[source]
+        except KeyError:
+            # Released instances are discarded once the stored instance they
+            # were created from no longer exists.
+            cls._pools.pop(source, None)
+            raise
+        pool = cls._pools.get(source)
+        if pool:
+            instance = pool.pop()
+        else:
+            instance = copy.deepcopy(prototype)
+        for key, value in kwargs.items():
+            setattr(instance, key, value)
         return instance   
 
 
-@dataclasses.dataclass
 class LibraryFactory(BaseFactory):
     """Mixin which automatically registers and stores subclasses and instances.
     
@@ -165,13 +250,16 @@ class LibraryFactory(BaseFactory):
     sought first. If no matching subclass is found, subclass instances are 
     searched. In either case, an instance is returned. If kwargs are passed,
     they are used to either initialize a subclass or added to an instance as
-    attributes.
+    attributes. Instances are registered in '__post_init__', so subclasses 
+    should be dataclasses or otherwise call '__post_init__' when they are 
+    initialized.
     
     Args:
         library (ClassVar[mapping.Library]): library of subclasses and 
             instances. 
             
     """
+    __slots__ = ()
     library: ClassVar[mapping.Library] = mapping.Library()
     
     """ Initialization Methods """
@@ -180,17 +268,18 @@ class LibraryFactory(BaseFactory):
     def __init_subclass__(cls, *args: Any, **kwargs: Any):
         """Automatically registers subclass."""
         # Because LibraryFactory is used as a mixin, it is important to
-        # call other base class '__init_subclass__' methods, if they exist.
-        try:
-            super().__init_subclass__(*args, **kwargs) # type: ignore
-        except AttributeError:
-            pass
+        # call other base class '__init_subclass__' methods.
+        super().__init_subclass__(*args, **kwargs) # type: ignore
         name = convert.namify(item = cls)
         cls.library.deposit(item = cls, name = name)
             
     def __post_init__(self) -> None:
-        with contextlib.suppress(AttributeError):
-            super().__post_init__(*args, **kwargs) # type: ignore
+        """Automatically registers subclass instance."""
+        # Because LibraryFactory is used as a mixin, it is important to
+        # call other base class '__post_init__' methods, if they exist.
+        post_init = getattr(super(), '__post_init__', None)
+        if post_init is not None:
+            post_init()
         key = convert.namify(item = self)
         self.__class__.library.deposit(item = self, name = key)
     
@@ -216,8 +305,7 @@ class LibraryFactory(BaseFactory):
         return cls.library.withdraw(source, **kwargs)
 
                    
-@dataclasses.dataclass
-class SourceFactory(BaseFactory, abc.ABC):
+class SourceFactory(BaseFactory):
     """Mixin that returns subclasses using 'sources' class attribute.
 
     Unlike typical factories, this one does not require an additional class 
@@ -236,9 +324,49 @@ class SourceFactory(BaseFactory, abc.ABC):
             the 'create' method will call the first method for which 'source' 
             matches a key, you should put specific types before general types in
             the 'sources' dict.
+        sources_order (ClassVar[tuple[Type, ...]]): types in 'sources' that 
+            should be checked first, in order. Listing the most common types of
+            'source' here avoids failed checks in the typical case. Types in 
+            'sources' that are not listed are checked afterwards in their 
+            'sources' order. Defaults to an empty tuple.
+    
+    When a subclass is created, 'sources' is frozen in a read-only mapping 
+    proxy. The types in 'sources' and their creation methods are then stored 
+    in the parallel '_kinds' and '_methods' tuples. A 
+    'create' classmethod is then compiled for the subclass with the checks for
+    each type written out in order. So, 'sources' and the corresponding 
+    creation methods should be complete when the subclass is defined. A 
+    subclass that defines or inherits a custom 'create' method is left 
+    unchanged.
     
     """
-    sources: ClassVar[Mapping[Type, str]] = {}
+    __slots__ = ()
+    sources: ClassVar[Mapping[Type, str]] = types.MappingProxyType({})
+    sources_order: ClassVar[tuple[Type, ...]] = ()
+    _kinds: ClassVar[tuple[Type, ...]] = ()
+    _methods: ClassVar[tuple[Optional[Callable[..., Any]], ...]] = ()
+    
+    """ Initialization Methods """
+    
+    @classmethod
+    def __init_subclass__(cls, *args: Any, **kwargs: Any):
+        """Compiles a 'create' classmethod specific to the subclass."""
+        # Because SourceFactory is used as a mixin, it is important to
+        # call other base class '__init_subclass__' methods.
+        super().__init_subclass__(*args, **kwargs) # type: ignore
+        if not isinstance(cls.sources, types.MappingProxyType):
+            cls.sources = types.MappingProxyType(dict(cls.sources))
+        ordered = [k for k in cls.sources_order if k in cls.sources]
+        ordered.extend(k for k in cls.sources if k not in ordered)
+        cls._kinds = tuple(ordered)
+        cls._methods = tuple(
+            getattr(cls, cls._get_create_method_name(source = cls.sources[k]), 
+                    None) 
+            for k in cls._kinds)
+        # Only 'create' methods defined in this module are replaced, so that a
+        # 'create' method written for a subclass is never overwritten.
+        if cls.create.__module__ == __name__:
+            cls.create = classmethod(cls._compile_create())
     
     """ Public Methods """
 
@@ -250,6 +378,11 @@ class SourceFactory(BaseFactory, abc.ABC):
         named f'from_{value in sources}'. If you would prefer a different naming
         format, you can subclass SourceFactory and override the 
         '_get_create_method_name' classmethod.
+        
+        Each subclass gets a compiled version of this method with the checks 
+        for its 'sources' written out (see '_compile_create'). SourceFactory 
+        itself has no 'sources', so calling this method on it always raises a
+        KeyError.
 
         Raises:
             AttributeError: If an appropriate method does not exist for the
@@ -258,22 +391,59 @@ class SourceFactory(BaseFactory, abc.ABC):
                 'sources'.
 
         Returns:
-            TypeFactory: instance of a SourceFactory.
+            SourceFactory: instance of a SourceFactory.
             
         """
-        for kind, suffix in cls.sources.items():
-            if isinstance(source, kind):
-                method_name = cls._get_create_method_name(source = suffix)
-                try:
-                    method = getattr(cls, method_name)
-                except AttributeError:
-                    raise AttributeError(f'{method_name} does not exist')
-                return method(source, **kwargs)
         raise KeyError(
             f'source does not match any recognized types in sources attribute')
 
     """ Private Methods """
     
+    @classmethod
+    def _compile_create(cls) -> Callable[..., SourceFactory]:
+        """Returns a 'create' function with the 'sources' checks written out.
+        
+        The returned function contains one 'isinstance' check for each key in
+        'sources', in order, and calls the matching creation method on the 
+        class it is called from. So, a subclass that overrides a creation 
+        method, but inherits a custom 'create' method that calls this one, 
+        still uses its own creation method. If a creation method does not 
+        exist, the returned function raises an AttributeError when a matching
+        'source' is passed. If 'source' matches no key in 'sources', it raises
+        a KeyError. The docstring of 'SourceFactory.create' is copied to the
+        returned function.
+        
+        Returns:
+            Callable[..., SourceFactory]: function to be used as the 'create'
+                classmethod of 'cls'.
+                
+        """
+        namespace: dict[str, Any] = {'__name__': __name__}
+        lines = ['def create(cls, source, **kwargs):']
+        for i, (kind, method) in enumerate(zip(cls._kinds, cls._methods)):
+            namespace[f'_kind{i}'] = kind
+            lines.append(f'    if isinstance(source, _kind{i}):')
+            name = cls._get_create_method_name(source = cls.sources[kind])
+            if method is not None and name.isidentifier():
+                lines.append(f'        return cls.{name}(source, **kwargs)')
+            else:
+                # Missing methods are looked up again when called because a 
+                # subclass using this 'create' may add them.
+                namespace[f'_name{i}'] = name
+                namespace[f'_error{i}'] = cls._get_missing_message(kind = kind)
+                lines.extend([
+                    f'        method = getattr(cls, _name{i}, None)',
+                    '        if method is None:',
+                    f'            raise AttributeError(_error{i})',
+                    '        return method(source, **kwargs)'])
+        lines.append(
+            "    raise KeyError('source does not match any recognized types in "
+            "sources attribute')")
+        exec('\n'.join(lines), namespace)
+        create = namespace['create']
+        create.__doc__ = SourceFactory.create.__doc__
+        return create
+    
     @classmethod
     def _get_create_method_name(cls, source: str) -> str:
         """Returns classmethod name for creating an instance.
@@ -284,9 +454,19 @@ class SourceFactory(BaseFactory, abc.ABC):
                 
         """
         return f'from_{source}'
+    
+    @classmethod
+    def _get_missing_message(cls, kind: Type) -> str:
+        """Returns error message for a missing creation method.
+        
+        Args:
+            kind (Type): key in 'sources' without a creation method.
+                
+        """
+        method_name = cls._get_create_method_name(source = cls.sources[kind])
+        return f'{method_name} does not exist'
       
 
-@dataclasses.dataclass
 class StealthFactory(BaseFactory):
     """Mixin that returns a subclass without requiring a new attribute.
     
@@ -300,6 +480,7 @@ class StealthFactory(BaseFactory):
     attributes.
     
     """
+    __slots__ = ()
         
     """ Public Methods """
 
@@ -317,15 +498,13 @@ class StealthFactory(BaseFactory):
             StealthFactory: a StealthFactory subclass.
             
         """
-        options = {
-            modify.snakify(item = s.__name__): s for s in cls.__subclasses__}
+        options = {convert.namify(item = s): s for s in cls.__subclasses__()}
         try:
             return options[source]
         except KeyError:
             raise KeyError(f'No subclass {source} was found')
         
 
-@dataclasses.dataclass
 class SubclassFactory(BaseFactory):
     """Mixin which automatically registers and stores subclasses.
     
@@ -337,6 +516,7 @@ class SubclassFactory(BaseFactory):
         subclasses (ClassVar[mapping.Catalog]): project catalog of subclasses.
             
     """
+    __slots__ = ()
     subclasses: ClassVar[mapping.Catalog] = mapping.Catalog()
     
     """ Initialization Methods """
@@ -345,9 +525,8 @@ class SubclassFactory(BaseFactory):
     def __init_subclass__(cls, *args: Any, **kwargs: Any):
         """Automatically registers subclass."""
         # Because SubclassFactory is used as a mixin, it is important to
-        # call other base class '__init_subclass__' methods, if they exist.
-        with contextlib.suppress(AttributeError):
-            super().__init_subclass__(*args, **kwargs) # type: ignore
+        # call other base class '__init_subclass__' methods.
+        super().__init_subclass__(*args, **kwargs) # type: ignore
         name = convert.namify(item = cls)
         cls.subclasses[name] = cls
     
@@ -368,8 +547,7 @@ class SubclassFactory(BaseFactory):
         return copy.deepcopy(cls.subclasses[source])
                     
                             
-@dataclasses.dataclass
-class TypeFactory(BaseFactory, abc.ABC):
+class TypeFactory(BaseFactory):
     """Mixin that returns subclass using the type or str name of the type.
 
     Unlike typical factories, this one does not require an additional class 
@@ -380,8 +558,27 @@ class TypeFactory(BaseFactory, abc.ABC):
     or name of the type passed. By default, using the '_get_create_method_name'
     method, the format for such methods should be 'from_{str name of type}'.
     
+    The creation method matching the name of the type of 'source' is always 
+    tried first. When a subclass is created, each creation method whose 
+    'source' parameter is annotated with a class is also registered with a 
+    'functools.singledispatch' dispatcher stored in '_dispatcher'. That 
+    dispatcher is only used when there is no creation method matching the name
+    of the type of 'source'.
+    
     """
+    __slots__ = ()
+    _dispatcher: ClassVar[Optional[Callable[..., TypeFactory]]] = None
     
+    """ Initialization Methods """
+    
+    @classmethod
+    def __init_subclass__(cls, *args: Any, **kwargs: Any):
+        """Builds a type dispatcher for the subclass's creation methods."""
+        # Because TypeFactory is used as a mixin, it is important to call other 
+        # base class '__init_subclass__' methods.
+        super().__init_subclass__(*args, **kwargs) # type: ignore
+        cls._dispatcher = cls._build_dispatcher()
+            
     """ Public Methods """
 
     @classmethod
@@ -389,9 +586,11 @@ class TypeFactory(BaseFactory, abc.ABC):
         """Calls construction method based on type of 'source'.
         
         For create to work properly, there should be a corresponding classmethod
-        named f'from_{snake-case str name of type}'. If you would prefer a 
-        different naming format, you can subclass TypeFactory and override the 
-        '_get_create_method_name' classmethod.
+        named f'from_{snake-case str name of type}' or a creation method with
+        its first parameter annotated with the type (or a parent type) of 
+        'source'. If you would prefer a different naming format, you can 
+        subclass TypeFactory and override the '_get_create_method_name' 
+        classmethod.
 
         Raises:
             AttributeError: If an appropriate method does not exist for the
@@ -401,16 +600,51 @@ class TypeFactory(BaseFactory, abc.ABC):
             TypeFactory: instance of a TypeFactory.
             
         """
-        suffix = modify.snakify(item = str(type(source)))
+        suffix = convert.namify(item = type(source))
         method_name = cls._get_create_method_name(item = suffix)
-        try:
-            method = getattr(cls, method_name)
-        except AttributeError:
+        method = getattr(cls, method_name, None)
+        if method is not None:
+            return method(source, **kwargs)
+        elif cls._dispatcher is not None:
+            return cls._dispatcher(source, **kwargs)
+        else:
             raise AttributeError(f'{method_name} does not exist')
-        return method(source, **kwargs)
 
     """ Private Methods """
     
+    @classmethod
+    def _build_dispatcher(cls) -> Optional[Callable[..., TypeFactory]]:
+        """Returns dispatcher for creation methods with annotated sources.
+        
+        Creation methods whose annotations cannot be resolved or whose 
+        'source' parameter is not annotated with a class are skipped.
+
+        Returns:
+            Optional[Callable[..., TypeFactory]]: a 'functools.singledispatch'
+                dispatcher or None, if no creation methods could be registered.
+                The default function of the dispatcher raises an 
+                AttributeError.
+            
+        """
+        prefix = cls._get_create_method_name(item = '')
+        dispatcher = None
+        for name in dir(cls):
+            if name.startswith(prefix):
+                method = getattr(cls, name)
+                try:
+                    parameters = inspect.signature(method).parameters
+                    hints = get_type_hints(method)
+                except (NameError, TypeError, ValueError):
+                    continue
+                first = next(iter(parameters), None)
+                kind = hints.get(first)
+                if isinstance(kind, type):
+                    if dispatcher is None:
+                        dispatcher = functools.singledispatch(
+                            cls._raise_missing)
+                    dispatcher.register(kind, method)
+        return dispatcher
+    
     @classmethod
     def _get_create_method_name(cls, item: str) -> str:
         """Returns classmethod name for creating an instance.
@@ -421,6 +655,19 @@ class TypeFactory(BaseFactory, abc.ABC):
                 
         """
         return f'from_{item}'
+    
+    @classmethod
+    def _raise_missing(cls, source: Any, **kwargs: Any) -> TypeFactory:
+        """Raises an error for a 'source' without a creation method.
+
+        Raises:
+            AttributeError: always, naming the creation method that matches the
+                name of the type of 'source'.
+            
+        """
+        suffix = convert.namify(item = type(source))
+        method_name = cls._get_create_method_name(item = suffix)
+        raise AttributeError(f'{method_name} does not exist')
 
              
 # @dataclasses.dataclass
@@ -34,18 +34,38 @@ from collections.abc import (
     Hashable, Iterator, Mapping, MutableMapping, Sequence)
 import copy
 import dataclasses
-import inspect
 from typing import Any, Optional, Type, Union
 
 from . import base
 from . import convert
+from . import modify
                   
 
-_ALL_KEYS: list[Any] = ['all', 'All', ['all'], ['All']]
-_DEFAULT_KEYS: list[Any] = [
-    'default', 'defaults', 'Default', 'Defaults', ['default'], ['defaults'], 
-    ['Default'], ['Defaults']]
-_NONE_KEYS: list[Any] = ['none', 'None', ['none'], ['None']]
+_ALL_KEYS: frozenset[str] = frozenset({'all', 'All'})
+_DEFAULT_KEYS: frozenset[str] = frozenset({
+    'default', 'defaults', 'Default', 'Defaults'})
+_NONE_KEYS: frozenset[str] = frozenset({'none', 'None'})
+
+
+def _get_wildcard(key: Any) -> Optional[str]:
+    """Returns str to check against wildcard keys for 'key'.
+    
+    Wildcard keys may be passed alone or as the only item in a list.
+    
+    Args:
+        key (Any): key passed to a Catalog.
+        
+    Returns:
+        Optional[str]: 'key' or the str in a single item list 'key'. If 'key'
+            is neither, None is returned.
+            
+    """
+    if isinstance(key, str):
+        return key
+    elif isinstance(key, list) and len(key) == 1 and isinstance(key[0], str):
+        return key[0]
+    else:
+        return None
 
 
 @dataclasses.dataclass  # type: ignore
@@ -303,10 +323,13 @@ class Catalog(Dictionary):
                 'contents' to delete the key/value pair.
 
         """
-        keys = list(convert.iterify(item = item))
-        if all(k in self for k in keys):
+        if isinstance(item, str):
+            keys = {item}
+        else:
+            keys = set(convert.iterify(item = item))
+        if all(k in self.contents for k in keys):
             self.contents = {
-                i: self.contents[i] for i in self.contents if i not in keys}
+                k: v for k, v in self.contents.items() if k not in keys}
         else:
             raise KeyError(f'{item} not found in the Catalog')
         return
@@ -328,14 +351,15 @@ class Catalog(Dictionary):
             Union[Any, Sequence[Any]]: value(s) stored in 'contents'.
 
         """
+        wildcard = _get_wildcard(key = key)
         # Returns a list of all values if the 'all' key is sought.
-        if key in _ALL_KEYS:
+        if wildcard in _ALL_KEYS:
             return list(self.contents.values())
         # Returns a list of values for keys listed in 'default' attribute.
-        elif key in _DEFAULT_KEYS:
+        elif wildcard in _DEFAULT_KEYS:
             return self[self.default]
         # Returns an empty list if a null value is sought.
-        elif key in _NONE_KEYS:
+        elif wildcard in _NONE_KEYS:
             if self.default_factory is None:
                 if self.always_return_list:
                     return []
@@ -379,11 +403,13 @@ class Catalog(Dictionary):
         return
 
 
+@modify.add_slots
 @dataclasses.dataclass  # type: ignore
 class Library(MutableMapping):
     """Stores classes instances and classes in a chained mapping.
     
-    When searching for matches, instances are prioritized over classes.
+    When searching for matches, instances are prioritized over classes. The
+    fields of Library are stored in '__slots__'.
     
     Args:
         classes (Catalog): a catalog of stored classes. Defaults to any empty
@@ -419,13 +445,14 @@ class Library(MutableMapping):
                 
         """
         key = name or convert.namify(item = item)
-        if inspect.isclass(item):
+        if isinstance(item, type):
             self.classes[key] = item
         elif isinstance(item, object):
             self.instances[key] = item
             # Key for the class will be different because it is inferred from
             # the class and not any attributes.
-            self.deposit(item = item.__class__)
+            kind = type(item)
+            self.classes[convert.namify(item = kind)] = kind
         else:
             raise TypeError(f'item must be a class or a class instance')
         return
@@ -483,24 +510,28 @@ class Library(MutableMapping):
                 found. If 'parameters' are passed, an instance is always returned.
             
         """
-        items = list(convert.iterify(item))
+        if isinstance(item, str):
+            items = [item]
+        else:
+            items = list(convert.iterify(item))
         item = None
+        catalogs = (self.instances, self.classes)
         for key in items:
-            for catalog in ['instances', 'classes']:
+            for catalog in catalogs:
                 try:
-                    item = getattr(self, catalog)[key]
+                    item = catalog[key]
                     break
                 except KeyError:
                     pass
             if item is not None:
                 break
         if item is None:
-            raise KeyError(f'No matching item for {item} was found')
+            raise KeyError(f'No matching item for {items} was found')
         if parameters is not None:
             if ('name' in item.__annotations__.keys() 
                     and 'name' not in parameters):
                 parameters['name'] = items[0]
-            if inspect.isclass(item):
+            if isinstance(item, type):
                 return item(**parameters)
             else:
                 instance = copy.deepcopy(item)
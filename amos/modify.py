@@ -38,27 +38,118 @@ Contents:
         drop_prefix_from_tuple
         drop_privates
         drop_substring (Callable, dispatcher): removes a substring from an item.
+        drop_substrings_from_list: removes substrings from items in a list.
         drop_suffix (Callable, dispatcher): removes a str suffix from an item.
     Other: 
         capitalify: converts a snake case str to capital case.
         snakify: converts a capital case str to snake case.
         uniquify: returns a unique key for a dict.
 
-ToDo:
-    Reintegrate dispatcher from ashworth package once it has been tested.
-
 """
 from __future__ import annotations
-
-from collections.abc import Hashable, Mapping, MutableSequence, Sequence, Set
+import abc
+from collections.abc import (
+    Callable, Hashable, Mapping, MutableSequence, Sequence, Set)
 import dataclasses
+import functools
 import re
-from typing import Any, Type
+import string
+from typing import Any, Optional, Type
+import weakref
+
+
+_LOWERCASE: frozenset[str] = frozenset(string.ascii_lowercase)
+_LOWERCASE_DIGITS: frozenset[str] = frozenset(
+    string.ascii_lowercase + string.digits)
+_UPPERCASE: frozenset[str] = frozenset(string.ascii_uppercase)
+
+def _dispatcher(item: Callable[..., Any]) -> Callable[..., Any]:
+    """Returns a 'functools.singledispatch' dispatcher for 'item'.
+    
+    Unlike 'functools.singledispatch', the returned dispatcher also accepts 
+    the dispatched argument as the 'item' keyword argument. The function for 
+    each exact type is also stored in a weakly keyed cache, so that repeated 
+    calls skip the 'functools.singledispatch' lookup. Like the cache in 
+    'functools.singledispatch', it is cleared whenever a function is 
+    registered or a class is registered as a virtual subclass of an abstract 
+    base class.
+    
+    Args:
+        item (Callable[..., Any]): default function to call when no registered
+            function supports the type of the first argument.
+            
+    Returns:
+        Callable[..., Any]: dispatcher with 'register', 'dispatch', and 
+            'registry' attributes.
+        
+    """
+    dispatcher = functools.singledispatch(item)
+    dispatch = dispatcher.dispatch
+    cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    cache_token = abc.get_cache_token()
+    name = getattr(item, '__name__', 'dispatcher')
+    
+    @functools.wraps(item)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        nonlocal cache_token
+        token = abc.get_cache_token()
+        if token != cache_token:
+            cache.clear()
+            cache_token = token
+        if args:
+            kind = args[0].__class__
+        elif 'item' in kwargs:
+            kind = kwargs['item'].__class__
+        else:
+            raise TypeError(
+                f'{name} requires a positional argument or an item keyword '
+                f'argument')
+        try:
+            function = cache[kind]
+        except KeyError:
+            function = cache[kind] = dispatch(kind)
+        return function(*args, **kwargs)
+    
+    def register(
+        kind: Any, 
+        function: Optional[Callable[..., Any]] = None) -> Callable[..., Any]:
+        if function is None and isinstance(kind, type):
+            return lambda f: register(kind, f)
+        registered = dispatcher.register(kind, function)
+        cache.clear()
+        return registered
+        
+    wrapper.register = register # type: ignore
+    wrapper.dispatch = dispatch # type: ignore
+    wrapper.registry = dispatcher.registry # type: ignore
+    return wrapper
+
+def _rebuild(item: Callable[..., Any]) -> Callable[..., Any]:
+    """Returns a function that rebuilds the result of 'item' as a vessel.
+    
+    The functions registered for dict, list, and set always return those 
+    built-in types. The returned function is registered for the matching 
+    abstract base classes so that other containers are rebuilt with their own
+    class.
+    
+    Args:
+        item (Callable[..., Any]): function to wrap.
+            
+    Returns:
+        Callable[..., Any]: wrapped function.
+        
+    """
+    @functools.wraps(item)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        vessel = (args[0] if args else kwargs['item']).__class__
+        return vessel(item(*args, **kwargs))
+    
+    return wrapper
 
 
 """ Adders """
 
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def add_prefix(item: Any, prefix: str, divider: str = '') -> Any:
     """Adds 'prefix' to 'item' with 'divider' in between.
     
@@ -77,7 +168,7 @@ def add_prefix(item: Any, prefix: str, divider: str = '') -> Any:
     """
     raise TypeError(f'item is not a supported type for {__name__}')
  
-# @add_prefix.register # type: ignore
+@add_prefix.register(str) # type: ignore
 def add_prefix_to_str(item: str, prefix: str, divider: str = '') -> str:
     """Adds 'prefix' to 'item' with 'divider' in between.
     
@@ -91,13 +182,16 @@ def add_prefix_to_str(item: str, prefix: str, divider: str = '') -> str:
         str: modified str.
 
     """
-    return divider.join([prefix, item])
+    if divider:
+        return prefix + divider + item
+    else:
+        return prefix + item
  
-# @add_prefix.register # type: ignore
+@add_prefix.register(dict) # type: ignore
 def add_prefix_to_dict(
     item: Mapping[str, Any],  
     prefix: str, 
-    divider: str = '') -> Mapping[str, Any]:
+    divider: str = '') -> dict[str, Any]:
     """Adds 'prefix' to keys in 'item' with 'divider' in between.
     
     Args:
@@ -107,23 +201,21 @@ def add_prefix_to_dict(
             which means no divider will be added.
 
     Returns:
-        Mapping[str, Any]: modified mapping.
+        dict[str, Any]: modified dict.
 
     """
-    contents = {
-        add_prefix(item = k, prefix = prefix, divider = divider): v 
-        for k, v in item.items()}
-    if isinstance(item, dict):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
- 
-# @add_prefix.register # type: ignore
+    if not prefix and not divider:
+        return dict(item)
+    full = prefix + divider
+    return {full + k: v for k, v in item.items()}
+
+add_prefix.register(Mapping, _rebuild(add_prefix_to_dict)) # type: ignore
+
+@add_prefix.register(list) # type: ignore
 def add_prefix_to_list(
     item: MutableSequence[str], 
     prefix: str, 
-    divider: str = '') -> MutableSequence[str]:
+    divider: str = '') -> list[str]:
     """Adds 'prefix' to items in 'item' with 'divider' in between.
     
     Args:
@@ -133,22 +225,21 @@ def add_prefix_to_list(
             which means no divider will be added.
 
     Returns:
-        Any: modified sequence.
+        list[str]: modified list.
 
     """
-    contents = [
-        add_prefix(item = i, prefix = prefix, divider = divider) for i in item]
-    if isinstance(item, list):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
- 
-# @add_prefix.register # type: ignore
+    if not prefix and not divider:
+        return list(item)
+    return list(map((prefix + divider).__add__, item))
+
+add_prefix.register(
+    MutableSequence, _rebuild(add_prefix_to_list)) # type: ignore
+
+@add_prefix.register(set) # type: ignore
 def add_prefix_to_set(
     item: Set[str], 
     prefix: str, 
-    divider: str = '') -> Set[str]:
+    divider: str = '') -> set[str]:
     """Adds 'prefix' to items in 'item' with 'divider' in between.
     
     Args:
@@ -158,18 +249,16 @@ def add_prefix_to_set(
             which means no divider will be added.
 
     Returns:
-        Set[str]: modified set.
+        set[str]: modified set.
 
     """
-    contents = {
-        add_prefix(item = i, prefix = prefix, divider = divider) for i in item}
-    if isinstance(item, set):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not prefix and not divider:
+        return set(item)
+    return set(map((prefix + divider).__add__, item))
+
+add_prefix.register(Set, _rebuild(add_prefix_to_set)) # type: ignore
 
-# @add_prefix.register # type: ignore
+@add_prefix.register(tuple) # type: ignore
 def add_prefix_to_tuple(
     item: tuple[str, ...], 
     prefix: str, 
@@ -189,9 +278,9 @@ def add_prefix_to_tuple(
         tuple[str, ...]: modified tuple.
 
     """
-    return tuple(
-        [add_prefix(item = i, prefix = prefix, divider = divider) 
-         for i in item])
+    if not prefix and not divider:
+        return item
+    return tuple(map((prefix + divider).__add__, item))
 
 def add_slots(item: Type[Any]) -> Type[Any]:
     """Adds slots to dataclass with default values.
@@ -218,13 +307,14 @@ def add_slots(item: Type[Any]) -> Type[Any]:
         for field_name in field_names:
             item_dict.pop(field_name, None)
         item_dict.pop('__dict__', None)
+        item_dict.pop('__weakref__', None)
         qualname = getattr(item, '__qualname__', None)
         item = type(item)(item.__name__, item.__bases__, item_dict) # type: ignore
         if qualname is not None:
             item.__qualname__ = qualname
     return item
 
-# @amos.dynamic.dispatcher # type: ignore 
+@_dispatcher
 def add_suffix(item: Any, suffix: str, divider: str = '') -> Any:
     """Adds 'suffix' to 'item' with 'divider' in between.
     
@@ -243,7 +333,7 @@ def add_suffix(item: Any, suffix: str, divider: str = '') -> Any:
     """
     raise TypeError(f'item is not a supported type for {__name__}')
  
-# @add_suffix.register # type: ignore
+@add_suffix.register(str) # type: ignore
 def add_suffix_to_str(item: str, suffix: str, divider: str = '') -> str:
     """Adds 'suffix' to 'item' with 'divider' in between.
     
@@ -257,13 +347,16 @@ def add_suffix_to_str(item: str, suffix: str, divider: str = '') -> str:
         str: modified item.
 
     """
-    return divider.join([item, suffix])
+    if divider:
+        return item + divider + suffix
+    else:
+        return item + suffix
  
-# @add_suffix.register # type: ignore
+@add_suffix.register(dict) # type: ignore
 def add_suffix_to_dict(
     item: Mapping[str, Any], 
     suffix: str, 
-    divider: str = '') -> Mapping[str, Any]:
+    divider: str = '') -> dict[str, Any]:
     """Adds 'suffix' to keys in 'item' with 'divider' in between.
     
     Args:
@@ -273,23 +366,21 @@ def add_suffix_to_dict(
             which means no divider will be added.
 
     Returns:
-        Mapping[str, Any]: modified mapping.
+        dict[str, Any]: modified dict.
 
     """
-    contents = {
-        add_suffix(item = k, suffix = suffix, divider = divider): v 
-        for k, v in item.items()}
-    if isinstance(item, dict):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
- 
-# @add_suffix.register # type: ignore
+    if not suffix and not divider:
+        return dict(item)
+    full = divider + suffix
+    return {k + full: v for k, v in item.items()}
+
+add_suffix.register(Mapping, _rebuild(add_suffix_to_dict)) # type: ignore
+
+@add_suffix.register(list) # type: ignore
 def add_suffix_to_list(
     item: MutableSequence[str], 
     suffix: str, 
-    divider: str = '') -> MutableSequence[str]:
+    divider: str = '') -> list[str]:
     """Adds 'suffix' to items in 'item' with 'divider' in between.
     
     Args:
@@ -299,22 +390,22 @@ def add_suffix_to_list(
             which means no divider will be added.
 
     Returns:
-        MutableSequence[str]: modified sequence.
+        list[str]: modified list.
 
     """
-    contents = [
-        add_suffix(item = i, suffix = suffix, divider = divider) for i in item]
-    if isinstance(item, list):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
- 
-# @add_suffix.register # type: ignore
+    if not suffix and not divider:
+        return list(item)
+    full = divider + suffix
+    return [i + full for i in item]
+
+add_suffix.register(
+    MutableSequence, _rebuild(add_suffix_to_list)) # type: ignore
+
+@add_suffix.register(set) # type: ignore
 def add_suffix_to_set(
     item: Set[str], 
     suffix: str, 
-    divider: str = '') -> Set[str]:
+    divider: str = '') -> set[str]:
     """Adds 'suffix' to items in 'item' with 'divider' in between.
     
     Args:
@@ -324,18 +415,17 @@ def add_suffix_to_set(
             which means no divider will be added.
 
     Returns:
-        Set[str]: modified set.
+        set[str]: modified set.
 
     """
-    contents = {add_suffix(item = i, suffix = suffix, divider = divider) 
-                for i in item}
-    if isinstance(item, set):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not suffix and not divider:
+        return set(item)
+    full = divider + suffix
+    return {i + full for i in item}
+
+add_suffix.register(Set, _rebuild(add_suffix_to_set)) # type: ignore
 
-# @add_suffix.register # type: ignore
+@add_suffix.register(tuple) # type: ignore
 def add_suffix_to_tuple(
     item: tuple[str, ...], 
     suffix: str, 
@@ -352,13 +442,14 @@ def add_suffix_to_tuple(
         tuple[str, ...]: modified tuple.
 
     """
-    return tuple(
-        [add_suffix(item = i, suffix = suffix, divider = divider) 
-         for i in item])
+    if not suffix and not divider:
+        return item
+    full = divider + suffix
+    return tuple([i + full for i in item])
 
 """ Dividers """
 
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def cleave(
     item: Any, 
     divider: Any,
@@ -384,7 +475,7 @@ def cleave(
     """
     raise TypeError(f'item is not a supported type for {__name__}')
 
-# @cleave.register # type: ignore
+@cleave.register(str) # type: ignore
 def cleave_str(
     item: str, 
     divider: str = '_',
@@ -408,19 +499,18 @@ def cleave_str(
             'divider' is not in 'item'.
         
     """
-    if divider in item:
-        if return_last:
-            suffix = item.split(divider)[-1]
-        else:
-            suffix = item.split(divider)[0]
-        prefix = item[:-len(suffix) - 1]
-    elif raise_error:
-        raise ValueError(f'{divider} is not in {item}')
+    if return_last:
+        prefix, found, suffix = item.rpartition(divider)
     else:
-        prefix = suffix = item
+        prefix, found, suffix = item.partition(divider)
+    if not found:
+        if raise_error:
+            raise ValueError(f'{divider} is not in {item}')
+        else:
+            prefix = suffix = item
     return prefix, suffix
 
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def separate(
     item: Any, 
     divider: Any,
@@ -443,7 +533,7 @@ def separate(
     """
     raise TypeError(f'item is not a supported type for {__name__}')
 
-# @separate.register # type: ignore
+@separate.register(str) # type: ignore
 def separate_str(
     item: str, 
     divider: str = '_',
@@ -473,7 +563,7 @@ def separate_str(
  
 """ Subtractors """
 
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def deduplicate(item: Any) -> Any:
     """Deduplicates contents of 'item.
     
@@ -489,25 +579,32 @@ def deduplicate(item: Any) -> Any:
     """
     raise TypeError(f'item is not a supported type for {__name__}')
 
-# @deduplicate.register # type: ignore
-def deduplicate_list(item: MutableSequence[Any]) -> MutableSequence[Any]:
+@deduplicate.register(list) # type: ignore
+def deduplicate_list(item: MutableSequence[Any]) -> list[Any]:
     """Deduplicates contents of 'item.
     
+    If 'item' contains unhashable elements, duplicates are found by equality
+    comparisons instead, which is slower for long sequences.
+    
     Args:
         item (MutableSequence[Any]): item to deduplicate.
 
     Returns:
-        MutableSequence[Any]: deduplicated item.
+        list[Any]: deduplicated item.
         
     """
-    contents = list(dict.fromkeys(item))
-    if isinstance(item, list):
-        return contents
-    else:
-        vessel = item.__class__(contents) # type: ignore
-        return vessel(contents) # type: ignore
-
-# @deduplicate.register # type: ignore
+    try:
+        contents = list(dict.fromkeys(item))
+    except TypeError:
+        contents = []
+        for i in item:
+            if i not in contents:
+                contents.append(i)
+    return contents
+
+deduplicate.register(MutableSequence, _rebuild(deduplicate_list)) # type: ignore
+
+@deduplicate.register(tuple) # type: ignore
 def deduplicate_tuple(item: tuple[Any, ...]) -> tuple[Any, ...]:
     """Deduplicates contents of 'item.
     
@@ -518,29 +615,27 @@ def deduplicate_tuple(item: tuple[Any, ...]) -> tuple[Any, ...]:
         tuple[Any, ...]: deduplicated item.
         
     """
-    return tuple(list(dict.fromkeys(item)))
+    return tuple(dict.fromkeys(item))
 
 def drop_dunders(item: list[Any]) -> list[Any]:
-    """Drops items in 'item' with names beginning with an underscore.
+    """Drops items in 'item' with names starting or ending with '__'.
 
     Args:
         item (list[Any]): attributes, methods, and properties of a class.
 
     Returns:
-        list[Any]: attributes, methods, and properties that do not start with an
-            underscore.
+        list[Any]: attributes, methods, and properties that do not start or 
+            end with double underscores.
         
     """
     if len(item) > 0 and hasattr(item[0], '__name__'):
         return [
             i for i in item 
-            if not i.__name__.startswith('__') 
-            and not i.__name__.endswith('__')]
+            if i.__name__[:2] != '__' and i.__name__[-2:] != '__']
     else:
-        return [
-            i for i in item if not i.startswith('__') and not i.endswith('__')]
+        return [i for i in item if i[:2] != '__' and i[-2:] != '__']
     
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def drop_prefix(item: Any, prefix: str, divider: str = '') -> Any:
     """Drops 'prefix' from 'item' with 'divider' in between.
     
@@ -559,7 +654,7 @@ def drop_prefix(item: Any, prefix: str, divider: str = '') -> Any:
     """
     raise TypeError(f'item is not a supported type for {__name__}')
 
-# @drop_prefix.register # type: ignore
+@drop_prefix.register(str) # type: ignore
 def drop_prefix_from_str(item: str, prefix: str, divider: str = '') -> str:
     """Drops 'prefix' from 'item' with 'divider' in between.
     
@@ -573,17 +668,13 @@ def drop_prefix_from_str(item: str, prefix: str, divider: str = '') -> str:
         str: modified str.
 
     """
-    prefix = ''.join([prefix, divider])
-    if item.startswith(prefix):
-        return item[len(prefix):]
-    else:
-        return item
+    return item.removeprefix(prefix + divider)
 
-# @drop_prefix.register # type: ignore
+@drop_prefix.register(dict) # type: ignore
 def drop_prefix_from_dict(
     item: Mapping[str, Any], 
     prefix: str, 
-    divider: str = '') -> Mapping[str, Any]:
+    divider: str = '') -> dict[str, Any]:
     """Drops 'prefix' from keys in 'item' with 'divider' in between.
     
     Args:
@@ -593,23 +684,21 @@ def drop_prefix_from_dict(
             which means no divider will be added.
  
     Returns:
-        Mapping[str, Any]: modified mapping.
+        dict[str, Any]: modified dict.
 
     """
-    contents = {
-        drop_prefix(item = k, prefix = prefix, divider = divider): v
-        for k, v in item.items()}
-    if isinstance(item, dict):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not prefix and not divider:
+        return dict(item)
+    full = prefix + divider
+    return {k.removeprefix(full): v for k, v in item.items()}
+
+drop_prefix.register(Mapping, _rebuild(drop_prefix_from_dict)) # type: ignore
 
-# @drop_prefix.register # type: ignore
+@drop_prefix.register(list) # type: ignore
 def drop_prefix_from_list(
     item: MutableSequence[str], 
     prefix: str, 
-    divider: str = '') -> MutableSequence[str]:
+    divider: str = '') -> list[str]:
     """Drops 'prefix' from items in 'item' with 'divider' in between.
     
     Args:
@@ -619,22 +708,22 @@ def drop_prefix_from_list(
             which means no divider will be added.
  
     Returns:
-        MutableSequence[str]: modified sequence.
+        list[str]: modified list.
 
     """
-    contents = [
-        drop_prefix(item = i, prefix = prefix, divider = divider) for i in item] 
-    if isinstance(item, list):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not prefix and not divider:
+        return list(item)
+    full = prefix + divider
+    return [i.removeprefix(full) for i in item]
+
+drop_prefix.register(
+    MutableSequence, _rebuild(drop_prefix_from_list)) # type: ignore
 
-# @drop_prefix.register # type: ignore
+@drop_prefix.register(set) # type: ignore
 def drop_prefix_from_set(
     item: Set[str], 
     prefix: str, 
-    divider: str = '') -> Set[str]:
+    divider: str = '') -> set[str]:
     """Drops 'prefix' from items in 'item' with 'divider' in between.
     
     Args:
@@ -644,18 +733,17 @@ def drop_prefix_from_set(
             which means no divider will be added.
  
     Returns:
-        Set[str]: modified set.
+        set[str]: modified set.
 
     """
-    contents = {
-        drop_prefix(item = i, prefix = prefix, divider = divider) for i in item}   
-    if isinstance(item, set):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore # type: ignore  
+    if not prefix and not divider:
+        return set(item)
+    full = prefix + divider
+    return {i.removeprefix(full) for i in item}
 
-# @drop_prefix.register # type: ignore
+drop_prefix.register(Set, _rebuild(drop_prefix_from_set)) # type: ignore
+
+@drop_prefix.register(tuple) # type: ignore
 def drop_prefix_from_tuple(
     item: tuple[str, ...], 
     prefix: str, 
@@ -672,9 +760,10 @@ def drop_prefix_from_tuple(
         tuple[str, ...]: modified tuple.
 
     """
-    return tuple(
-        [drop_prefix(item = i, prefix = prefix, divider = divider) 
-         for i in item])       
+    if not prefix and not divider:
+        return item
+    full = prefix + divider
+    return tuple([i.removeprefix(full) for i in item])
 
 def drop_privates(item: list[Any]) -> list[Any]:
     """Drops items in 'item' with names beginning with an underscore.
@@ -688,11 +777,11 @@ def drop_privates(item: list[Any]) -> list[Any]:
         
     """
     if len(item) > 0 and hasattr(item[0], '__name__'):
-        return [i for i in item if not i.__name__.startswith('_')]
+        return [i for i in item if i.__name__[:1] != '_']
     else:
-        return [i for i in item if not i.startswith('_')]
+        return [i for i in item if i[:1] != '_']
               
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def drop_substring(item: Any, substring: str) -> Any:
     """Drops 'substring' from 'item' with a possible 'divider' in between.
     
@@ -709,7 +798,7 @@ def drop_substring(item: Any, substring: str) -> Any:
     """
     raise TypeError(f'item is not a supported type for {__name__}')
 
-# @drop_substring.register # type: ignore
+@drop_substring.register(str) # type: ignore
 def drop_substring_from_str(item: str, substring: str) -> str:
     """Drops 'substring' from 'item'.
     
@@ -721,15 +810,12 @@ def drop_substring_from_str(item: str, substring: str) -> str:
         str: modified str.
 
     """
-    if substring in item:
-        return item.replace(substring, '')
-    else:
-        return item
+    return item.replace(substring, '')
 
-# @drop_substring.register # type: ignore
+@drop_substring.register(dict) # type: ignore
 def drop_substring_from_dict(
     item: Mapping[str, Any], 
-    substring: str) -> Mapping[str, Any]:
+    substring: str) -> dict[str, Any]:
     """Drops 'substring' from keys in 'item'.
     
     Args:
@@ -737,22 +823,20 @@ def drop_substring_from_dict(
         substring (str): substring to be added to 'item'.
 
     Returns:
-        Mapping[str, Any]: modified mapping.
+        dict[str, Any]: modified dict.
 
     """
-    contents = {
-        drop_substring(item = k, substring = substring): v
-        for k, v in item.items()}
-    if isinstance(item, dict):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not substring:
+        return dict(item)
+    return {k.replace(substring, ''): v for k, v in item.items()}
 
-# @drop_substring.register # type: ignore
+drop_substring.register(
+    Mapping, _rebuild(drop_substring_from_dict)) # type: ignore
+
+@drop_substring.register(list) # type: ignore
 def drop_substring_from_list(
     item: MutableSequence[str], 
-    substring: str) -> MutableSequence[str]:
+    substring: str) -> list[str]:
     """Drops 'substring' from items in 'item'.
     
     Args:
@@ -760,18 +844,18 @@ def drop_substring_from_list(
         substring (str): substring to be added to 'item'.
 
     Returns:
-        MutableSequence[str]: modified sequence.
+        list[str]: modified list.
 
     """
-    contents = [drop_substring(item = i, substring = substring) for i in item] 
-    if isinstance(item, list):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not substring:
+        return list(item)
+    return [i.replace(substring, '') for i in item]
 
-# @drop_substring.register # type: ignore
-def drop_substring_from_set(item: Set[str], substring: str) -> Set[str]:
+drop_substring.register(
+    MutableSequence, _rebuild(drop_substring_from_list)) # type: ignore
+
+@drop_substring.register(set) # type: ignore
+def drop_substring_from_set(item: Set[str], substring: str) -> set[str]:
     """Drops 'substring' from items in 'item'.
     
     Args:
@@ -779,17 +863,16 @@ def drop_substring_from_set(item: Set[str], substring: str) -> Set[str]:
         substring (str): substring to be added to 'item'.
 
     Returns:
-        Set[str]: modified set.
+        set[str]: modified set.
 
     """
-    contents = {drop_substring(item = i, substring = substring) for i in item}   
-    if isinstance(item, set):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore # type: ignore  
+    if not substring:
+        return set(item)
+    return {i.replace(substring, '') for i in item}
+
+drop_substring.register(Set, _rebuild(drop_substring_from_set)) # type: ignore
 
-# @drop_substring.register # type: ignore 
+@drop_substring.register(tuple) # type: ignore
 def drop_substring_from_tuple(
     item: tuple[str, ...], 
     substring: str) -> tuple[str, ...]:
@@ -803,10 +886,53 @@ def drop_substring_from_tuple(
         tuple[str, ...]: modified tuple.
 
     """
-    return tuple(
-        [drop_substring(item = i, substring = substring) for i in item])    
+    if not substring:
+        return item
+    return tuple([i.replace(substring, '') for i in item])
+
+def drop_substrings_from_list(
+    item: MutableSequence[str], 
+    substrings: Sequence[str]) -> MutableSequence[str]:
+    """Drops all 'substrings' from items in 'item'.
+    
+    The items are joined into a single str and every substring is removed in
+    one scan of a compiled regular expression, instead of scanning each item 
+    once per substring. Because of this, text that only forms a substring
+    after another substring is removed is left in place.
+    
+    Args:
+        item (MutableSequence[str]): item to be modified.
+        substrings (Sequence[str]): substrings to be removed from items in 
+            'item'.
+
+    Returns:
+        MutableSequence[str]: modified sequence.
+
+    """
+    substrings = [s for s in substrings if s]
+    if not substrings or not item:
+        contents = list(item)
+    elif len(substrings) == 1:
+        contents = [i.replace(substrings[0], '') for i in item]
+    else:
+        # Longer substrings are listed first so that they take precedence 
+        # over substrings they contain.
+        ordered = sorted(substrings, key = len, reverse = True)
+        pattern = re.compile('|'.join(re.escape(s) for s in ordered))
+        buffer = '\x00'.join(item)
+        if (
+            buffer.count('\x00') == len(item) - 1 
+            and not any('\x00' in s for s in substrings)):
+            contents = pattern.sub('', buffer).split('\x00')
+        else:
+            contents = [pattern.sub('', i) for i in item]
+    if isinstance(item, list):
+        return contents
+    else:
+        vessel = item.__class__
+        return vessel(contents) # type: ignore
      
-# @amos.dynamic.dispatcher # type: ignore
+@_dispatcher
 def drop_suffix(item: Any, suffix: str, divider: str = '') -> Any:
     """Drops 'suffix' from 'item' with 'divider' in between.
     
@@ -823,7 +949,7 @@ def drop_suffix(item: Any, suffix: str, divider: str = '') -> Any:
     """
     raise TypeError(f'item is not a supported type for {__name__}')
 
-# @drop_suffix.register # type: ignore
+@drop_suffix.register(str) # type: ignore
 def drop_suffix_from_str(item: str, suffix: str, divider: str = '') -> str:
     """Drops 'suffix' from 'item' with 'divider' in between.
     
@@ -835,17 +961,13 @@ def drop_suffix_from_str(item: str, suffix: str, divider: str = '') -> str:
         str: modified str.
 
     """
-    suffix = ''.join([suffix, divider])
-    if item.endswith(suffix):
-        return item.removesuffix(suffix)
-    else:
-        return item
+    return item.removesuffix(divider + suffix)
 
-# drop_suffix.register # type: ignore
+@drop_suffix.register(dict) # type: ignore
 def drop_suffix_from_dict(
     item: Mapping[str, Any], 
     suffix: str, 
-    divider: str = '') -> Mapping[str, Any]:
+    divider: str = '') -> dict[str, Any]:
     """Drops 'suffix' from keys in 'item' with 'divider' in between.
     
     Args:
@@ -853,23 +975,21 @@ def drop_suffix_from_dict(
         suffix (str): suffix to be added to 'item'.
 
     Returns:
-        Mapping[str, Any]: modified mapping.
+        dict[str, Any]: modified dict.
 
     """
-    contents = {
-        drop_suffix(item = k, suffix = suffix, divider = divider): v 
-        for k, v in item.items()}
-    if isinstance(item, dict):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not suffix and not divider:
+        return dict(item)
+    full = divider + suffix
+    return {k.removesuffix(full): v for k, v in item.items()}
 
-# @drop_suffix.register # type: ignore
+drop_suffix.register(Mapping, _rebuild(drop_suffix_from_dict)) # type: ignore
+
+@drop_suffix.register(list) # type: ignore
 def drop_suffix_from_list(
     item: MutableSequence[str], 
     suffix: str, 
-    divider: str = '') -> MutableSequence[str]:
+    divider: str = '') -> list[str]:
     """Drops 'suffix' from items in 'item' with 'divider' in between.
     
     Args:
@@ -877,22 +997,22 @@ def drop_suffix_from_list(
         suffix (str): suffix to be added to 'item'.
 
     Returns:
-        MutableSequence[str]: modified sequence.
+        list[str]: modified list.
 
     """
-    contents = [
-        drop_suffix(item = i, suffix = suffix, divider = divider) for i in item]
-    if isinstance(item, list):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore
+    if not suffix and not divider:
+        return list(item)
+    full = divider + suffix
+    return [i.removesuffix(full) for i in item]
+
+drop_suffix.register(
+    MutableSequence, _rebuild(drop_suffix_from_list)) # type: ignore
 
-# @drop_suffix.register # type: ignore
+@drop_suffix.register(set) # type: ignore
 def drop_suffix_from_set(
     item: Set[str], 
     suffix: str, 
-    divider: str = '') -> Set[str]:
+    divider: str = '') -> set[str]:
     """Drops 'suffix' from items in 'item' with 'divider' in between.
     
     Args:
@@ -900,18 +1020,17 @@ def drop_suffix_from_set(
         suffix (str): suffix to be added to 'item'.
 
     Returns:
-        Set[str]: modified set.
+        set[str]: modified set.
 
     """
-    contents = {
-        drop_suffix(item = i, suffix = suffix, divider = divider) for i in item}      
-    if isinstance(item, set):
-        return contents
-    else:
-        vessel = item.__class__
-        return vessel(contents) # type: ignore # type: ignore  
+    if not suffix and not divider:
+        return set(item)
+    full = divider + suffix
+    return {i.removesuffix(full) for i in item}
+
+drop_suffix.register(Set, _rebuild(drop_suffix_from_set)) # type: ignore
 
-# @drop_suffix.register # type: ignore
+@drop_suffix.register(tuple) # type: ignore
 def drop_suffix_from_tuple(
     item: tuple[str, ...], 
     suffix: str, 
@@ -926,14 +1045,19 @@ def drop_suffix_from_tuple(
         tuple[str, ...]: modified tuple.
 
     """
-    return tuple(
-        [drop_suffix(item = i, suffix = suffix, divider = divider) 
-         for i in item])        
+    if not suffix and not divider:
+        return item
+    full = divider + suffix
+    return tuple([i.removesuffix(full) for i in item])
 
 """ Other Modifiers """
 
+@functools.lru_cache(maxsize = 4096)
 def capitalify(item: str) -> str:
     """Converts a snake case str to capital case.
+    
+    Results are cached because the same identifiers are usually converted 
+    many times.
 
     Args:
         item (str): str to convert.
@@ -944,8 +1068,15 @@ def capitalify(item: str) -> str:
     """
     return item.replace('_', ' ').title().replace(' ', '')
 
+@functools.lru_cache(maxsize = 4096)
 def snakify(item: str) -> str:
     """Converts a capitalized str to snake case.
+    
+    An underscore is added before an uppercase letter that either follows a
+    lowercase letter or digit or starts a capitalized word. 'item' is scanned 
+    once instead of being passed through multiple regular expressions. 
+    Results are cached because the same identifiers are usually converted 
+    many times.
 
     Args:
         item (str): str to convert.
@@ -954,14 +1085,27 @@ def snakify(item: str) -> str:
         str: 'item' converted to snake case.
 
     """
-    item = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', item)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', item).lower()
+    last = len(item) - 1
+    characters = []
+    for i, character in enumerate(item):
+        if i > 0 and character in _UPPERCASE:
+            previous = item[i - 1]
+            if (
+                previous in _LOWERCASE_DIGITS
+                or (
+                    previous != '\n' 
+                    and i < last 
+                    and item[i + 1] in _LOWERCASE)):
+                characters.append('_')
+        characters.append(character)
+    return ''.join(characters).lower()
 
 def uniquify(key: str, dictionary: Mapping[Hashable, Any]) -> str:
     """Creates a unique key name to avoid overwriting an item in 'dictionary'.
     
     The function is 1-indexed so that the first attempt to avoid a duplicate
-    will be: "old_name2".
+    will be: "old_name2". Numbers are tried in order, so the lowest unused 
+    number is returned and gaps in the numbering are filled.
 
     Args:
         key (str): name of key to test.
@@ -975,11 +1119,9 @@ def uniquify(key: str, dictionary: Mapping[Hashable, Any]) -> str:
     if key not in dictionary:
         return key
     else:
-        counter = 1
+        counter = 2
         while True:
-            counter += 1
-            if counter > 2:
-                name = name.removesuffix(str(counter - 1))
-            name = ''.join([key, str(counter)])
+            name = key + str(counter)
             if name not in dictionary:
-                return name 
\ No newline at end of file
+                return name
+            counter += 1 
\ No newline at end of file
@@ -25,11 +25,12 @@ Contents:
         
 """
 from __future__ import annotations
-from collections.abc import Callable, MutableMapping, Sequence
-import copy
+import collections
+from collections.abc import Callable, Mapping, MutableMapping, Sequence
 import dataclasses
 import functools
 import inspect
+import types
 from typing import Any, ClassVar, Optional, Type, Union
 
 from . import convert
@@ -63,14 +64,49 @@ class registered(object):
              to an empty dict.
         namer (Callable[[Any], str]): function to infer key names of wrapped
             functions and classes. Defaults to the 'namify' function in amos.
+        _registry (ClassVar[dict[str, Callable[..., Optional[Any]]]]): items 
+            added with the 'register' method. 
+        _version (ClassVar[int]): counter incremented each time an item is 
+            added with the 'register' method. It is used to tell when the 
+            merged snapshot returned by 'registry' is stale.
     
     """
     wrapped: Callable[..., Optional[Any]]
     defaults: dict[str, Callable[..., Optional[Any]]] = dataclasses.field(
         default_factory = dict)
     namer: Callable[[Any], str] = convert.namify
+    _merged: Mapping[str, Callable[..., Optional[Any]]] = dataclasses.field(
+        default_factory = dict, init = False, repr = False, compare = False)
+    _merged_defaults: dict[str, Callable[..., Optional[Any]]] = (
+        dataclasses.field(
+            default_factory = dict, 
+            init = False, 
+            repr = False, 
+            compare = False))
+    _merged_version: int = dataclasses.field(
+        default = -1, init = False, repr = False, compare = False)
+    _registry: ClassVar[dict[str, Callable[..., Optional[Any]]]] = {}
+    _registry_view: ClassVar[Mapping[str, Callable[..., Optional[Any]]]] = (
+        types.MappingProxyType(_registry))
+    _version: ClassVar[int] = 0
     
     """ Initialization Methods """
+    
+    def __post_init__(self) -> None:
+        """Copies attributes once when the decorator is applied."""
+        # Updates 'wrapped' for proper introspection and traceback.
+        functools.update_wrapper(self, self.wrapped)
+        # Copies key attributes and functions to wrapped item.
+        self.wrapped.register = self.register
+        # Uses a live, read-only view so that later registrations are visible
+        # and so that it matches the 'registry' property.
+        if self.defaults:
+            self.wrapped.registry = types.MappingProxyType(
+                collections.ChainMap(self.defaults, self._registry))
+        else:
+            self.wrapped.registry = self._registry_view
+        if isinstance(self.wrapped, type):
+            self.wrapped.__init_subclass__ = Registrar.__init_subclass__
         
     def __call__(
         self, 
@@ -82,32 +118,36 @@ class registered(object):
             Callable[..., Optional[Any]]: callable after it has been registered.
         
         """
-        # Updates 'wrapped' for proper introspection and traceback.
-        functools.update_wrapper(self, self.wrapped)
-        # Copies key attributes and functions to wrapped item.
-        self.wrapped.register = self.register
-        self.wrapped.registry = self.__class__.registry
-        if inspect.isclass(self.wrapped):
-            self.wrapped.__init_subclass__ = Registrar.__init_subclass__
         return self.wrapped(*args, **kwargs)        
 
     """ Properties """
     
     @property
-    def registry(self) -> MutableMapping[str, Type[Any]]:
+    def registry(self) -> Mapping[str, Type[Any]]:
         """Returns internal registry.
         
+        If there are 'defaults', a merged snapshot of 'defaults' and the 
+        registered items is returned. The snapshot is only rebuilt after an
+        item is added with the 'register' method or 'defaults' is changed. 
+        Items in 'defaults' take priority over registered items with the same
+        key. Either way, the returned mapping is read-only so that the stored 
+        registry and snapshot cannot be changed by callers.
+        
         Returns:
-            MutableMapping[str, Type[Any]]: dict of str keys and values of
+            Mapping[str, Type[Any]]: mapping of str keys and values of
                 registered items.
                 
         """
-        if self.defaults:
-            complete = copy.deepcopy(self._registry)
-            complete.update(self.defaults)
-            return complete 
-        else:
-            return self._registry
+        if not self.defaults:
+            return self._registry_view
+        if (
+            self._merged_version != self._version 
+            or self._merged_defaults != self.defaults):
+            self._merged = types.MappingProxyType(
+                {**self._registry, **self.defaults})
+            self._merged_defaults = dict(self.defaults)
+            self._merged_version = self._version
+        return self._merged
     
     """ Public Methods """
     
@@ -115,10 +155,18 @@ class registered(object):
     def register(cls, item: Type[Any], name: Optional[str] = None) -> None:
         """Adds 'item' to 'registry'.
         
+        Args:
+            item (Type[Any]): a class or function to add to the registry.
+            name (Optional[str]): name to use as the key when 'item' is stored
+                in 'registry'. Defaults to None. If not passed, the 'namer'
+                function will be used to create a key.
+                    
         """
-        # The default key for storing cls is its snakecase name.
-        key = name or cls.namer(cls)
-        cls.registry[key] = item
+        # The default key for storing 'item' is its snakecase name.
+        key = name or cls.namer(item)
+        cls._registry[key] = item
+        # '_registry' is shared by all subclasses, so the counter is as well.
+        registered._version += 1
         return
 
 
@@ -126,13 +174,24 @@ class registered(object):
 class Registrar(object):
     """Mixin which automatically registers subclasses.
     
+    Abstract subclasses are not registered. A subclass may set the 
+    '_registry_key' class attribute to choose its key in 'registry'. 
+    Otherwise, the key is created once using the 'namify' function and stored
+    in '_registry_key'.
+    
     Args:
         registry (ClassVar[MutableMapping[str, Type[Any]]]): key names are str
             names of a subclass (snake_case by default) and values are the 
             subclasses. Defaults to an empty dict.  
+        _auto_register (ClassVar[bool]): whether a subclass should be 
+            automatically registered. It is only checked in the subclass's own
+            namespace, so setting it to False on an intermediate mixin does not
+            prevent that mixin's subclasses from being registered. Defaults to 
+            True.
             
     """
     registry: ClassVar[MutableMapping[str, Type[Any]]] = {}
+    _auto_register: ClassVar[bool] = True
     
     """ Initialization Methods """
     
@@ -145,7 +204,14 @@ class Registrar(object):
             super().__init_subclass__(*args, **kwargs) # type: ignore
         except AttributeError:
             pass
-        cls.register(item = cls)
+        if (
+            cls.__dict__.get('_auto_register', True) 
+            and not inspect.isabstract(cls)):
+            key = cls.__dict__.get('_registry_key')
+            if key is None:
+                key = convert.namify(item = cls)
+                cls._registry_key = key
+            cls.register(item = cls, name = key)
 
     """ Public Methods """
     
@@ -166,6 +232,6 @@ class Registrar(object):
         # if abc.ABC not in cls.__bases__:
         # The default key for storing cls relies on the 'namify' method, 
         # which usually will use the snakecase name of 'item'.
-        key = name or convert.namify(item = cls)
+        key = name or convert.namify(item = item)
         cls.registry[key] = item
         return   
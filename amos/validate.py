@@ -42,24 +42,32 @@ def bondafide(
     include = include or []
     exclude = exclude or []
     def validator(wrapped: Type[Any]) -> Any:
+        # The attributes to check and their types are found once, when 
+        # 'wrapped' is decorated, rather than each time an instance is created.
+        annotations = wrapped.__annotations__
+        names = tuple(annotations.keys())
+        attributes = include or names
+        kinds = {
+            a: annotations[a] for a in attributes 
+            if a not in exclude and a in annotations}
+        
         @functools.wraps(wrapped)
         def wrapper(*args: Any, **kwargs: Any) -> object:
-            kwargs.update(convert.kwargify(args = args, item = wrapped))
+            kwargs.update(
+                convert.kwargify(args = args, item = wrapped, names = names))
             instance = wrapped(**kwargs)
-            attributes = include or wrapped.__annotations__.keys()
-            attributes = [a for a in attributes if a not in exclude] # type: ignore
-            for attribute in attributes:
-                try:
-                    kind = wrapped.__annotations__[attribute]
-                    key = kind.__name__
-                    value = getattr(instance, attribute)
-                    if not isinstance(value, kind):
-                        converter = convert.catalog[key]
+            for attribute, kind in kinds.items():
+                value = getattr(instance, attribute)
+                if not isinstance(value, kind):
+                    try:
+                        converter = convert.catalog[kind.__name__]
+                    except KeyError:
+                        pass
+                    else:
                         new_value = converter(item = value)
                         setattr(instance, attribute, new_value)
-                except KeyError:
-                    pass
             return instance
+        
         return wrapper
     if _wrapped is None:
         return validator
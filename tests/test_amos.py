@@ -20,6 +20,9 @@ ToDo:
     
 """
 from __future__ import annotations
+import abc
+import collections
+from collections.abc import MutableSequence, Sequence
 import dataclasses
 
 import amos
@@ -141,6 +144,29 @@ def test_catalog():
     assert len(catalog) == 1
     return
     
+def test_catalog_wildcards():
+    catalog = amos.Catalog(
+        contents = {'a': 1, 'b': 2, 'c': 3}, 
+        default = ['a', 'b'])
+    assert catalog['all'] == [1, 2, 3]
+    assert catalog[['all']] == [1, 2, 3]
+    assert catalog['All'] == [1, 2, 3]
+    assert catalog['Defaults'] == [1, 2]
+    assert catalog[['Defaults']] == [1, 2]
+    assert catalog['none'] is None
+    assert catalog[['a', 'c', 'missing']] == [1, 3]
+    catalog.delete(['a', 'b'])
+    assert catalog.contents == {'c': 3}
+    catalog.delete('c')
+    assert catalog.contents == {}
+    try:
+        catalog.delete(['missing'])
+    except KeyError:
+        pass
+    else:
+        assert False
+    return
+    
 def test_library():
     library = amos.Library(classes = amos.Catalog(contents = {
         'tester': TestClass}))
@@ -156,6 +182,369 @@ def test_library():
     # print('test library', library)
     assert 'random_name' not in library
     return
+
+def test_instance_factory():
+    
+    @dataclasses.dataclass
+    class Parent(object):
+        
+        def __post_init__(self) -> None:
+            self.initialized = True
+    
+    @dataclasses.dataclass
+    class Registered(amos.InstanceFactory, Parent):
+        
+        name: str = 'registered'
+        
+        def reset(self) -> None:
+            self.name = 'registered'
+    
+    @dataclasses.dataclass
+    class Unresettable(amos.InstanceFactory):
+        
+        name: str = 'unresettable'
+        
+    registered = Registered()
+    assert registered.initialized
+    assert amos.InstanceFactory.instances['registered'] is registered
+    copied = Registered.create('registered', name = 'copied')
+    assert copied.name == 'copied'
+    assert registered.name == 'registered'
+    Registered.release(copied, source = 'registered')
+    reused = Registered.create('registered')
+    assert reused is copied
+    assert reused == registered
+    assert Registered.create('registered') is not copied
+    assert not Unresettable._pools
+    created = [
+        Registered.create('registered') 
+        for _ in range(Registered._pool_limit + 1)]
+    for instance in created:
+        Registered.release(instance, source = 'registered')
+    assert len(Registered._pools['registered']) == Registered._pool_limit
+    unresettable = Unresettable()
+    try:
+        Unresettable.release(
+            Unresettable.create('unresettable'), 
+            source = 'unresettable')
+    except AttributeError:
+        pass
+    else:
+        assert False
+    renamed = Registered.create('registered', name = 'renamed')
+    try:
+        Registered.release(renamed, source = 'renamed')
+    except KeyError:
+        pass
+    else:
+        assert False
+    del registered, copied, reused, created, instance, renamed
+    try:
+        Registered.create('registered')
+    except KeyError:
+        pass
+    else:
+        assert False
+    assert 'registered' not in Registered._pools
+    return
+
+def test_source_factory():
+    
+    class Made(amos.SourceFactory):
+        
+        sources = {bool: 'bool', int: 'int', str: 'str'}
+        
+        @classmethod
+        def from_int(cls, source: int, offset: int = 0) -> int:
+            return source + offset
+        
+        @classmethod
+        def from_bool(cls, source: bool) -> str:
+            return 'bool'
+    
+    class Ordered(Made):
+        
+        sources_order = (int,)
+        
+    class Custom(Made):
+        
+        @classmethod
+        def create(cls, source, **kwargs) -> str:
+            if isinstance(source, str):
+                return 'custom'
+            return super().create(source, **kwargs)
+    
+    class Overridden(Custom):
+        
+        @classmethod
+        def from_int(cls, source: int, offset: int = 0) -> int:
+            return -source
+        
+        @classmethod
+        def from_str(cls, source: str) -> str:
+            return 'str'
+    
+    assert Made.create(2, offset = 1) == 3
+    assert Made.create(True) == 'bool'
+    assert Ordered.create(True) == 1
+    assert Ordered._kinds == (int, bool, str)
+    try:
+        Made.create('a')
+    except AttributeError:
+        pass
+    else:
+        assert False
+    try:
+        Made.create(1.5)
+    except KeyError:
+        pass
+    else:
+        assert False
+    assert Custom.create('a') == 'custom'
+    assert Custom.create(2) == 2
+    assert Overridden.create(2) == -2
+    assert super(Custom, Overridden).create('a') == 'str'
+    assert Made.create.__doc__ == amos.SourceFactory.create.__doc__
+    try:
+        amos.SourceFactory.create(2)
+    except KeyError:
+        pass
+    else:
+        assert False
+    return
+
+def test_dispatchers():
+    
+    class Box(object):
+        
+        def __init__(self, contents: list[str]) -> None:
+            self.contents = list(contents)
+            
+        def __iter__(self):
+            return iter(self.contents)
+    
+    assert amos.add_prefix('b', 'a', '_') == 'a_b'
+    assert amos.add_prefix(item = ['b', 'c'], prefix = 'a') == ['ab', 'ac']
+    dropped = amos.drop_suffix(item = {'a_x': 1}, suffix = 'x', divider = '_')
+    assert dropped == {'a': 1}
+    deque = amos.add_suffix(collections.deque(['a', 'b']), 'z')
+    assert isinstance(deque, collections.deque)
+    assert list(deque) == ['az', 'bz']
+    chained = amos.add_prefix(
+        item = collections.ChainMap({'b': 1}), 
+        prefix = 'a')
+    assert isinstance(chained, collections.ChainMap)
+    assert chained == {'ab': 1}
+    try:
+        amos.add_prefix(Box(['b']), 'a')
+    except TypeError:
+        pass
+    else:
+        assert False
+    MutableSequence.register(Box)
+    boxed = amos.add_prefix(Box(['b']), 'a')
+    assert isinstance(boxed, Box)
+    assert boxed.contents == ['ab']
+    try:
+        amos.add_prefix(prefix = 'a')
+    except TypeError:
+        pass
+    else:
+        assert False
+    return
+
+def test_drop_substrings_from_list():
+    assert amos.drop_substrings_from_list(['abc', 'xbx'], ['b']) == [
+        'ac', 'xx']
+    assert amos.drop_substrings_from_list(['abx', 'ax'], ['a', 'ab']) == [
+        'x', 'x']
+    assert amos.drop_substrings_from_list(['a\x00b', 'cab'], ['a', 'b']) == [
+        '\x00', 'c']
+    assert amos.drop_substrings_from_list(['ab'], ['', 'b']) == ['a']
+    dropped = amos.drop_substrings_from_list(
+        collections.deque(['ab', 'cb']), 
+        ['b', 'c'])
+    assert isinstance(dropped, collections.deque)
+    assert list(dropped) == ['a', '']
+    return
+
+def test_cleave():
+    assert amos.cleave('a_b_c', '_') == ('a_b', 'c')
+    assert amos.cleave('a_b_c', '_', return_last = False) == ('a', 'b_c')
+    assert amos.cleave('a::b::c', '::') == ('a::b', 'c')
+    assert amos.cleave('a::b::c', '::', return_last = False) == ('a', 'b::c')
+    assert amos.cleave('abc', '_') == ('abc', 'abc')
+    try:
+        amos.cleave('abc', '_', raise_error = True)
+    except ValueError:
+        pass
+    else:
+        assert False
+    return
+
+def test_snakify():
+    assert amos.snakify('CamelCase') == 'camel_case'
+    assert amos.snakify('HTTPServer') == 'http_server'
+    assert amos.snakify('getHTTPResponseCode') == 'get_http_response_code'
+    assert amos.snakify('a1B') == 'a1_b'
+    assert amos.snakify('Abc') == 'abc'
+    assert amos.snakify('ABC') == 'abc'
+    assert amos.snakify('_Ab') == '__ab'
+    assert amos.snakify('a\nBc') == 'a\nbc'
+    # Only ASCII letters mark word boundaries, as in the original '[A-Z]' and
+    # '[a-z0-9]' regular expressions.
+    assert amos.snakify('aÉcole') == 'aécole'
+    assert amos.snakify('ÉcoleNormale') == 'école_normale'
+    assert amos.snakify('aBé') == 'a_bé'
+    return
+
+def test_capitalify():
+    assert amos.capitalify('snake_case_name') == 'SnakeCaseName'
+    assert amos.capitalify('abc1def') == 'Abc1Def'
+    assert amos.capitalify('a b') == 'AB'
+    assert amos.capitalify('ab-cd') == 'Ab-Cd'
+    return
+
+def test_uniquify():
+    assert amos.uniquify('k', {}) == 'k'
+    assert amos.uniquify('k', {'k': 1}) == 'k2'
+    assert amos.uniquify('k', {'k': 1, 'k2': 2, 'k5': 5}) == 'k3'
+    return
+
+def test_registrar():
+    
+    class RegistrarBase(amos.Registrar):
+        pass
+    
+    class AbstractRegistrar(RegistrarBase, abc.ABC):
+        
+        @abc.abstractmethod
+        def method(self) -> None:
+            pass
+        
+    class ConcreteRegistrar(AbstractRegistrar):
+        
+        def method(self) -> None:
+            pass
+    
+    class HiddenRegistrar(RegistrarBase):
+        
+        _auto_register = False
+    
+    class VisibleRegistrar(HiddenRegistrar):
+        pass
+    
+    class KeyedRegistrar(RegistrarBase):
+        
+        _registry_key = 'custom_key'
+    
+    registry = amos.Registrar.registry
+    assert registry['registrar_base'] is RegistrarBase
+    assert 'abstract_registrar' not in registry
+    assert registry['concrete_registrar'] is ConcreteRegistrar
+    assert 'hidden_registrar' not in registry
+    assert registry['visible_registrar'] is VisibleRegistrar
+    assert registry['custom_key'] is KeyedRegistrar
+    return
+
+def test_registered():
+    
+    def wrapped() -> str:
+        return 'wrapped'
+    
+    decorator = amos.registered(wrapped, defaults = {'a': 1})
+    assert decorator() == 'wrapped'
+    assert decorator.registry['a'] == 1
+    decorator.defaults['b'] = 2
+    assert decorator.registry['b'] == 2
+    decorator.defaults['b'] = 3
+    assert decorator.registry['b'] == 3
+    assert decorator == amos.registered(wrapped, defaults = {'a': 1, 'b': 3})
+    for registry in (decorator.registry, wrapped.registry):
+        try:
+            registry['c'] = 4
+        except TypeError:
+            pass
+        else:
+            assert False
+    assert wrapped.registry['b'] == 3
+    return
+
+def test_instance_factory_attributes():
+    
+    @dataclasses.dataclass
+    class Settable(amos.InstanceFactory):
+        
+        name: str = 'settable'
+        _x: int = 0
+        
+        @property
+        def x(self) -> int:
+            return self._x
+        
+        @x.setter
+        def x(self, value: int) -> None:
+            self._x = value
+    
+    @dataclasses.dataclass(frozen = True)
+    class Frozen(amos.InstanceFactory):
+        
+        name: str = 'frozen'
+            
+    settable = Settable()
+    created = Settable.create('settable', x = 2)
+    assert created.x == 2
+    assert 'x' not in created.__dict__
+    assert settable.x == 0
+    frozen = Frozen()
+    try:
+        Frozen.create('frozen', name = 'changed')
+    except dataclasses.FrozenInstanceError:
+        pass
+    else:
+        assert False
+    assert frozen.name == 'frozen'
+    return
+
+def test_type_factory():
+    
+    class Made(amos.TypeFactory):
+        
+        @classmethod
+        def from_int(cls, source: int) -> str:
+            return 'int'
+        
+        @classmethod
+        def from_bool(cls, source) -> str:
+            return 'bool'
+        
+        @classmethod
+        def from_sequence(cls, source: Sequence) -> str:
+            return 'sequence'
+        
+        @classmethod
+        def from_anything(cls, source: object) -> str:
+            return 'anything'
+    
+    assert Made.create(5) == 'int'
+    assert Made.create(True) == 'bool'
+    assert Made.create([1, 2]) == 'sequence'
+    assert Made.create(1.5) == 'anything'
+    
+    class Unannotated(amos.TypeFactory):
+        
+        @classmethod
+        def from_str(cls, source) -> str:
+            return 'str'
+        
+    assert Unannotated.create('a') == 'str'
+    try:
+        Unannotated.create(1.5)
+    except AttributeError:
+        pass
+    else:
+        assert False
+    return
  
 if __name__ == '__main__':
     # test_proxy()
@@ -163,5 +552,18 @@ if __name__ == '__main__':
     test_hybrid()
     test_dictionary()
     test_catalog()
+    test_catalog_wildcards()
     test_library()
+    test_instance_factory()
+    test_instance_factory_attributes()
+    test_type_factory()
+    test_source_factory()
+    test_dispatchers()
+    test_drop_substrings_from_list()
+    test_cleave()
+    test_snakify()
+    test_capitalify()
+    test_uniquify()
+    test_registrar()
+    test_registered()
    
\ No newline at end of file